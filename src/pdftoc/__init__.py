@@ -1,11 +1,11 @@
 # PDF TOC Generator
 
-from pdftoc.bookmarks import add_bookmarks, get_existing_bookmarks, verify_bookmarks
-from pdftoc.core import process_pdf
-from pdftoc.models import ExtractionMode, TocEntry
-from pdftoc.ocr import pdf_has_text, run_ocr
-from pdftoc.section_headers import extract_section_headers
-from pdftoc.toc_extraction import extract_toc_from_text
+# Re-exports resolve lazily (PEP 562): importing the package must not drag in
+# PyMuPDF and the whole processing stack, or the CLI pays for it on every
+# `--help` and shell completion. `from pdftoc import process_pdf` still works;
+# it just imports `pdftoc.core` at that moment instead of at package load.
+
+from typing import Any
 
 __all__ = [
     "ExtractionMode",
@@ -19,3 +19,28 @@ __all__ = [
     "verify_bookmarks",
     "process_pdf",
 ]
+
+_EXPORTS = {
+    "ExtractionMode": "pdftoc.models",
+    "TocEntry": "pdftoc.models",
+    "pdf_has_text": "pdftoc.ocr",
+    "run_ocr": "pdftoc.ocr",
+    "extract_toc_from_text": "pdftoc.toc_extraction",
+    "extract_section_headers": "pdftoc.section_headers",
+    "add_bookmarks": "pdftoc.bookmarks",
+    "get_existing_bookmarks": "pdftoc.bookmarks",
+    "verify_bookmarks": "pdftoc.bookmarks",
+    "process_pdf": "pdftoc.core",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _EXPORTS:
+        from importlib import import_module
+
+        return getattr(import_module(_EXPORTS[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
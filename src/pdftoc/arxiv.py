@@ -1,8 +1,10 @@
 """arXiv source download functionality."""
 
 import re
+import shutil
 import tarfile
 import zipfile
+from functools import lru_cache
 from io import BytesIO
 from pathlib import Path
 from urllib.error import HTTPError
@@ -12,6 +14,17 @@ import fitz  # type: ignore
 
 from pdftoc.pdf_text import page_text
 
+# One alternation covering every way a PDF cites its own arXiv ID: an
+# "arXiv:" watermark or an arxiv.org URL, in the new YYMM.NNNNN or the old
+# category/YYMMNNN format. A single traversal finds any of them.
+_ARXIV_ID_RE = re.compile(
+    r"(?:arXiv[:\s]+|arxiv\.org/(?:abs|pdf)/)"
+    r"(\d{4}\.\d{4,5}(?:v\d+)?|[a-z\-]+/\d{7}(?:v\d+)?)",
+    re.IGNORECASE,
+)
+
+_VERSION_RE = re.compile(r"v\d+$")
+
 
 def extract_arxiv_id(pdf_path: Path) -> str | None:
     """
@@ -23,40 +36,35 @@ def extract_arxiv_id(pdf_path: Path) -> str | None:
     - arxiv.org/abs/2307.01234
     - arxiv.org/pdf/2307.01234
     """
+    # Keyed on mtime as well as path, so a rewritten file is re-read while
+    # batch runs over a directory never open the same PDF twice.
+    return _extract_arxiv_id(pdf_path, pdf_path.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=128)
+def _extract_arxiv_id(pdf_path: Path, _mtime_ns: int) -> str | None:
     doc: fitz.Document = fitz.open(pdf_path)
     try:
-        # Check first few pages (arXiv ID usually on first page)
-        pages_to_check = min(3, len(doc))
-        full_text = ""
-        for i in range(pages_to_check):
-            page: fitz.Page = doc[i]
-            full_text += page_text(page) + "\n"
-
-        # Patterns to match arXiv IDs
-        patterns = [
-            # New format: YYMM.NNNNN (with optional version)
-            r"arXiv[:\s]+(\d{4}\.\d{4,5}(?:v\d+)?)",
-            r"arxiv\.org/(?:abs|pdf)/(\d{4}\.\d{4,5}(?:v\d+)?)",
-            # Old format: category/YYMMNNN
-            r"arXiv[:\s]+([a-z\-]+/\d{7}(?:v\d+)?)",
-            r"arxiv\.org/(?:abs|pdf)/([a-z\-]+/\d{7}(?:v\d+)?)",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, full_text, re.IGNORECASE)
+        # Check first few pages, stopping at the first hit: the arXiv ID is
+        # almost always the page-1 watermark, so later pages rarely get read.
+        for page in doc.pages(0, min(3, len(doc))):
+            match = _ARXIV_ID_RE.search(page_text(page))
             if match:
-                arxiv_id = match.group(1)
                 # Strip version suffix for source URL
-                arxiv_id = re.sub(r"v\d+$", "", arxiv_id)
-                return arxiv_id
+                return _VERSION_RE.sub("", match.group(1))
 
         return None
     finally:
         doc.close()
 
 
+@lru_cache(maxsize=128)
 def check_source_available(arxiv_id: str) -> bool:
-    """Check if arXiv source is available for the given ID."""
+    """Check if arXiv source is available for the given ID.
+
+    Cached per ID: availability does not change within a session, and each
+    miss costs a network round-trip with a 10 s timeout.
+    """
     url = f"https://arxiv.org/src/{arxiv_id}"
     try:
         req = Request(url, method="HEAD")
@@ -84,39 +92,60 @@ def download_arxiv_source(
         req = Request(url)
         req.add_header("User-Agent", "pdftoc/1.0")
         with urlopen(req, timeout=60) as response:
-            content = response.read()
             content_type = response.headers.get("Content-Type", "")
 
-        # Create output directory
-        extract_dir = output_dir / f"arxiv-{arxiv_id.replace('/', '-')}"
-        extract_dir.mkdir(parents=True, exist_ok=True)
-
-        # Determine archive type and extract
-        if "gzip" in content_type or "tar" in content_type:
-            # Most common: .tar.gz
-            with tarfile.open(fileobj=BytesIO(content), mode="r:*") as tar:
-                tar.extractall(extract_dir)
-            if verbose:
-                print(f"Extracted tar archive to: {extract_dir}")
-        elif "zip" in content_type:
-            with zipfile.ZipFile(BytesIO(content)) as zf:
-                zf.extractall(extract_dir)
-            if verbose:
-                print(f"Extracted zip archive to: {extract_dir}")
-        else:
-            # Try tar.gz first (most common), then other formats
-            try:
-                with tarfile.open(fileobj=BytesIO(content), mode="r:*") as tar:
+            # Create output directory
+            extract_dir = output_dir / f"arxiv-{arxiv_id.replace('/', '-')}"
+            extract_dir.mkdir(parents=True, exist_ok=True)
+
+            # Determine archive type and extract
+            if "gzip" in content_type or "tar" in content_type:
+                # Most common: .tar.gz. Stream straight off the socket:
+                # "r|*" reads sequentially, so download, gunzip and extraction
+                # overlap and the archive is never held in memory whole.
+                # Members are written serially: streaming mode cannot seek, and
+                # a source archive is a handful of small text files, so the
+                # network dominates the write phase anyway.
+                with tarfile.open(
+                    fileobj=response, mode="r|*", bufsize=64 * 1024
+                ) as tar:
                     tar.extractall(extract_dir)
                 if verbose:
-                    print(f"Extracted archive to: {extract_dir}")
-            except tarfile.TarError:
-                # Maybe it's a single file (e.g., .tex)
-                # Save as-is
-                single_file = extract_dir / "source.tex"
-                single_file.write_bytes(content)
+                    print(f"Extracted tar archive to: {extract_dir}")
+            elif "zip" in content_type:
+                # Zip needs random access to its central directory, so it has
+                # to be buffered whole.
+                with zipfile.ZipFile(BytesIO(response.read())) as zf:
+                    zf.extractall(extract_dir)
                 if verbose:
-                    print(f"Saved single file to: {single_file}")
+                    print(f"Extracted zip archive to: {extract_dir}")
+            else:
+                # Unknown type: sniff the first tar block. A gzip magic or a
+                # "ustar" signature means an archive worth buffering for the
+                # tar attempt; anything else is a single file (e.g., .tex) and
+                # streams to disk without ever holding the body in memory.
+                head = response.read(512)
+                looks_tar = head[:2] == b"\x1f\x8b" or head[257:262] == b"ustar"
+                if looks_tar:
+                    content = head + response.read()
+                    try:
+                        with tarfile.open(fileobj=BytesIO(content), mode="r:*") as tar:
+                            tar.extractall(extract_dir)
+                        if verbose:
+                            print(f"Extracted archive to: {extract_dir}")
+                    except tarfile.TarError:
+                        # Signature lied; save as-is after all.
+                        single_file = extract_dir / "source.tex"
+                        single_file.write_bytes(content)
+                        if verbose:
+                            print(f"Saved single file to: {single_file}")
+                else:
+                    single_file = extract_dir / "source.tex"
+                    with single_file.open("wb") as fh:
+                        fh.write(head)
+                        shutil.copyfileobj(response, fh, length=1 << 20)
+                    if verbose:
+                        print(f"Saved single file to: {single_file}")
 
         return extract_dir
 
@@ -150,30 +179,25 @@ def get_arxiv_source(pdf_path: Path, output_dir: Path | None, verbose: bool) ->
 
     print(f"Found arXiv ID: {arxiv_id}")
 
-    # Check if source is available
-    print("Checking source availability...")
-    if not check_source_available(arxiv_id):
-        print("✗ Source not available - author didn't upload source files")
-        raise SystemExit(1)
-
-    # Download source
     if output_dir is None:
         output_dir = pdf_path.parent
 
+    # No separate availability HEAD: the download's own 404 answers the same
+    # question, so going straight to the GET saves a full round-trip.
     print("Downloading source...")
     result = download_arxiv_source(arxiv_id, output_dir, verbose)
 
-    if result:
-        print(f"✓ Source downloaded to: {result}")
-
-        # List main files
-        tex_files = list(result.glob("**/*.tex"))
-        if tex_files:
-            print(f"  Found {len(tex_files)} .tex file(s):")
-            for tf in tex_files[:5]:
-                print(f"    - {tf.relative_to(result)}")
-            if len(tex_files) > 5:
-                print(f"    ... and {len(tex_files) - 5} more")
-    else:
-        print("✗ Failed to download source")
+    if result is None:
+        print("✗ Source not available - author didn't upload source files")
         raise SystemExit(1)
+
+    print(f"✓ Source downloaded to: {result}")
+
+    # List main files
+    tex_files = list(result.glob("**/*.tex"))
+    if tex_files:
+        print(f"  Found {len(tex_files)} .tex file(s):")
+        for tf in tex_files[:5]:
+            print(f"    - {tf.relative_to(result)}")
+        if len(tex_files) > 5:
+            print(f"    ... and {len(tex_files) - 5} more")
@@ -1,7 +1,11 @@
 """Bookmark management for PDFs."""
 
+import heapq
 import math
+import os
 import re
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import StrEnum
 from pathlib import Path
@@ -23,6 +27,10 @@ from pdftoc.pdf_text import page_text
 # printed folio lives.
 _MARGIN_FRACTION = 0.12
 
+# Substantial words of a title, compiled once: content verification runs this
+# per sampled bookmark, and re-compilation per entry is avoidable overhead.
+_KEYWORDS_RE = re.compile(r"[A-Za-z]{4,}")
+
 
 class BookmarkDefect(StrEnum):
     """What is wrong with a document's existing bookmarks.
@@ -51,6 +59,26 @@ class BookmarkIssue:
         return self.detail
 
 
+def _cached_text(doc: fitz.Document) -> Callable[[int], str]:
+    """Lazily extracted plain text per 1-indexed PDF page.
+
+    Verification and offset search both read overlapping pages, and PyMuPDF
+    text extraction is the dominant cost per page. Scoping the cache to one
+    call tree rather than memoizing per-doc globally means it dies with the
+    document handle instead of outliving it.
+    """
+    cache: dict[int, str] = {}
+
+    def text_for(pdf_page: int) -> str:
+        text = cache.get(pdf_page)
+        if text is None:
+            text = page_text(doc[pdf_page - 1])
+            cache[pdf_page] = text
+        return text
+
+    return text_for
+
+
 def find_malformed_destinations(doc: fitz.Document) -> list[str]:
     """Titles whose destination names the right page but cannot drive a jump.
 
@@ -138,12 +166,18 @@ def _check_count(doc: fitz.Document, bookmarks: list[TocEntry]) -> BookmarkIssue
     return None
 
 
-def _title_matches_page(doc: fitz.Document, entry: TocEntry) -> bool:
+def _title_matches_page(text_for: Callable[[int], str], entry: TocEntry) -> bool:
     """Whether any substantial word of the title appears on its target page."""
-    text = page_text(doc[entry.page - 1]).lower()
-    keywords = [w.lower() for w in re.findall(r"[A-Za-z]{4,}", entry.title)]
+    text = text_for(entry.page).lower()
+    keywords = [w.lower() for w in _KEYWORDS_RE.findall(entry.title)]
     if not keywords:
         return True
+    # Tokenizing once turns the common hit into hash lookups instead of one
+    # substring scan per keyword. The substring pass stays as a fallback so an
+    # inflected form on the page ("algebras" for "algebra") still counts.
+    page_tokens = set(_KEYWORDS_RE.findall(text))
+    if any(kw in page_tokens for kw in keywords):
+        return True
     return any(kw in text for kw in keywords)
 
 
@@ -151,10 +185,14 @@ def _check_content(
     doc: fitz.Document, bookmarks: list[TocEntry]
 ) -> list[BookmarkIssue]:
     """Sample entries and confirm the target page looks like the right one."""
+    text_for = _cached_text(doc)
     issues: list[BookmarkIssue] = []
     sample_size = min(5, len(bookmarks))
-    # Prefer bookmarks not on page 1 for content verification.
-    sample = sorted(bookmarks, key=lambda b: (b.page == 1, b.page))[:sample_size]
+    # Prefer bookmarks not on page 1 for content verification. nsmallest picks
+    # the sample without sorting the full list.
+    sample = heapq.nsmallest(
+        sample_size, bookmarks, key=lambda b: (b.page == 1, b.page)
+    )
 
     mismatches = 0
     for entry in sample:
@@ -165,7 +203,7 @@ def _check_content(
                     f"Bookmark '{entry.title}' points to invalid page {entry.page}",
                 )
             )
-        elif not _title_matches_page(doc, entry):
+        elif not _title_matches_page(text_for, entry):
             mismatches += 1
 
     if mismatches > sample_size // 2:
@@ -232,7 +270,7 @@ def add_bookmarks(
     doc: fitz.Document = fitz.open(pdf_path)
 
     try:
-        page_map = find_page_map(doc, toc_entries, verbose)
+        page_map = find_page_map(doc, toc_entries, verbose, pdf_path=pdf_path)
 
         # Normalize levels - PyMuPDF requires first entry to be level 1
         # and levels must not skip (e.g., can't go from 1 to 3)
@@ -270,27 +308,15 @@ def _normalize_levels(toc_entries: list[TocEntry]) -> list[TocEntry]:
     if not toc_entries:
         return []
 
-    # Find minimum level
+    # Shifting so the minimum level is 1 and capping level skips (a level may
+    # only increase by 1 at a time) fuse into one pass: only the shift needs
+    # the whole list up front, and only for its minimum.
     min_level = min(e.level for e in toc_entries)
 
-    # Shift all levels so minimum is 1
-    shifted = [
-        TocEntry(
-            level=e.level - min_level + 1,
-            title=e.title,
-            page=e.page,
-            page_ref=e.page_ref,
-        )
-        for e in toc_entries
-    ]
-
-    # Ensure no level skips (level can only increase by 1 at a time)
     result: list[TocEntry] = []
     prev_level = 0
-    for entry in shifted:
-        new_level = entry.level
-        if new_level > prev_level + 1:
-            new_level = prev_level + 1
+    for entry in toc_entries:
+        new_level = min(entry.level - min_level + 1, prev_level + 1)
         result.append(
             TocEntry(
                 level=new_level,
@@ -325,6 +351,42 @@ def _margin_folios(page: fitz.Page) -> tuple[Folio, ...]:
     return tuple(sorted(folios, key=lambda f: (f.ref, f.number)))
 
 
+# Below this, thread-pool startup costs more than the folio scan it spreads.
+_PARALLEL_FOLIO_MIN_PAGES = 50
+
+
+def _folios_by_page(
+    doc: fitz.Document, pdf_path: Path | None
+) -> dict[int, tuple[Folio, ...]]:
+    """Margin folios for every page, scanned in parallel when worthwhile.
+
+    MuPDF releases the GIL during extraction, so threads genuinely overlap --
+    but a `Document` handle must not be shared across threads. Each worker
+    therefore opens its own handle on `pdf_path` and scans a contiguous slice;
+    without a path to reopen, the scan stays serial.
+    """
+    total = len(doc)
+    if pdf_path is None or total < _PARALLEL_FOLIO_MIN_PAGES:
+        return {i + 1: _margin_folios(doc[i]) for i in range(total)}
+
+    workers = min(8, os.cpu_count() or 4)
+
+    def scan(span: range) -> list[tuple[int, tuple[Folio, ...]]]:
+        local: fitz.Document = fitz.open(pdf_path)
+        try:
+            return [(i + 1, _margin_folios(local[i])) for i in span]
+        finally:
+            local.close()
+
+    per_worker = math.ceil(total / workers)
+    spans = [
+        range(start, min(start + per_worker, total))
+        for start in range(0, total, per_worker)
+    ]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return dict(pair for chunk in pool.map(scan, spans) for pair in chunk)
+
+
 def _decimal_label_ranges(doc: fitz.Document) -> tuple[tuple[int, int], ...]:
     """`/PageLabels` ranges numbered in plain decimals, as `(start, first_num)`.
 
@@ -365,11 +427,13 @@ def _page_label_offset(doc: fitz.Document) -> tuple[int, str] | None:
     return offset, f"/PageLabels: PDF p.{start_page + 1} is printed p.{first_num}"
 
 
-def _toc_page_indices(doc: fitz.Document) -> frozenset[int]:
+def _toc_page_indices(
+    doc: fitz.Document, text_for: Callable[[int], str]
+) -> frozenset[int]:
     """1-indexed PDF pages that look like the table of contents itself."""
     indices: set[int] = set()
     for i in range(min(15, len(doc))):
-        if "contents" in str(doc[i].get_text()).lower():
+        if "contents" in text_for(i + 1).lower():
             # The TOC usually spans a few pages; exclude its neighbours too.
             indices.update(j for j in range(i, i + 3) if 0 <= j < len(doc))
             if i > 0:
@@ -378,12 +442,18 @@ def _toc_page_indices(doc: fitz.Document) -> frozenset[int]:
 
 
 def find_page_map(
-    doc: fitz.Document, toc_entries: list[TocEntry], verbose: bool
+    doc: fitz.Document,
+    toc_entries: list[TocEntry],
+    verbose: bool,
+    pdf_path: Path | None = None,
 ) -> PageMap:
     """
     Find the mapping between printed page numbers and PDF page indices.
 
     Returns a PageMap such that: pdf_page = printed_page + offset
+
+    `pdf_path`, when given, lets the folio scan spread across threads with a
+    private document handle per worker.
     """
     if not toc_entries:
         return PageMap(0, 0.0, PageMapSource.DEFAULT, "no TOC entries")
@@ -397,13 +467,18 @@ def find_page_map(
         if e.page_ref == PageRef.PRINTED_ARABIC and e.page >= 1
     ]
 
+    # The keyword fallback scores every probe at every candidate offset, so
+    # the same PDF page is queried many times over; the TOC-page scan reads
+    # those pages again. One cache covers both.
+    text_for = _cached_text(doc)
+
     page_map = resolve_page_map(
-        folios_by_page={i + 1: _margin_folios(doc[i]) for i in range(len(doc))},
+        folios_by_page=_folios_by_page(doc, pdf_path),
         titled_pages=probes,
-        page_text=lambda pdf_page: str(doc[pdf_page - 1].get_text()),
+        page_text=text_for,
         total_pages=len(doc),
         label_offset=_page_label_offset(doc),
-        skip_pages=_toc_page_indices(doc),
+        skip_pages=_toc_page_indices(doc, text_for),
     )
 
     if verbose:
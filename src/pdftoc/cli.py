@@ -2,19 +2,18 @@
 """CLI tool to add TOC bookmarks to PDFs."""
 
 import os
+import sys
 from contextlib import AbstractContextManager, nullcontext
 from pathlib import Path
-from typing import Annotated
+from typing import Annotated, Any
 
-import fitz  # type: ignore
 import typer
 
-from pdftoc.arxiv import get_arxiv_source
-from pdftoc.core import ExtractionMode, atomic_output, process_pdf
-from pdftoc.deepdoc_headers import extract_section_headers_with_deepdoc
-from pdftoc.models import OcrBackend, TocEntry, format_toc_plaintext
-from pdftoc.toc_extraction import extract_toc_from_text
-from pdftoc.version import collect_build_info, format_build_info
+# Only cheap imports at module scope: the CLI module loads for `--help`,
+# `--version` and shell completion too, and pulling in the processing stack
+# (PyMuPDF and friends) costs real startup time those paths never repay.
+# Everything heavy is imported inside the command that needs it.
+from pdftoc.models import ExtractionMode, OcrBackend
 
 app = typer.Typer(
     name="pdftoc",
@@ -22,9 +21,22 @@ app = typer.Typer(
 )
 
 
+def __getattr__(name: str) -> Any:
+    # process_pdf and atomic_output stay addressable as module attributes --
+    # tests monkeypatch `pdftoc.cli.process_pdf` -- but resolve on first use so
+    # importing this module never loads the processing stack.
+    if name in ("process_pdf", "atomic_output"):
+        from pdftoc import core
+
+        return getattr(core, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def _version_callback(requested: bool) -> None:
     """Print provenance and exit before Typer enforces the required --from."""
     if requested:
+        from pdftoc.version import collect_build_info, format_build_info
+
         print(format_build_info(collect_build_info()))
         raise typer.Exit()
 
@@ -200,6 +212,8 @@ def main(
     """Process a PDF to add TOC bookmarks based on detected table of contents."""
     # Handle arXiv source download mode
     if get_arxiv_source_flag:
+        from pdftoc.arxiv import get_arxiv_source
+
         get_arxiv_source(source, arxiv_output_dir, verbose)
         return
 
@@ -221,6 +235,10 @@ def main(
     # Regular TOC processing needs exactly one destination. In place, the write
     # goes to a sibling staging file that is renamed over the source only once
     # processing returns cleanly (see `atomic_output`).
+    # Attribute access through the module (not a local `from` import) so a
+    # monkeypatched `pdftoc.cli.process_pdf` is honoured.
+    this = sys.modules[__name__]
+
     destination: AbstractContextManager[Path]
     if in_place:
         if output is not None:
@@ -229,7 +247,7 @@ def main(
         if not os.access(source, os.W_OK):
             print(f"Error: --in-place needs write permission on {source}")
             raise typer.Exit(1)
-        destination = atomic_output(source)
+        destination = this.atomic_output(source)
     elif output is None:
         print("Error: --to/-t output path is required (or use --in-place/-i)")
         raise typer.Exit(1)
@@ -247,7 +265,7 @@ def main(
 
     # Both modes share one call so they cannot drift apart.
     with destination as target:
-        process_pdf(
+        this.process_pdf(
             source=source,
             output=target,
             skip_ocr=skip_ocr,
@@ -272,7 +290,14 @@ def _dump_toc_plaintext(
     end_page: int | None = None,
 ) -> None:
     """Extract and print TOC as formatted plaintext."""
-    from pdftoc.deepdoc_headers import extract_headers_deepdoctection
+    import fitz  # type: ignore
+
+    from pdftoc.deepdoc_headers import (
+        extract_headers_deepdoctection,
+        extract_section_headers_with_deepdoc,
+    )
+    from pdftoc.models import TocEntry, format_toc_plaintext
+    from pdftoc.toc_extraction import extract_toc_from_text
 
     doc: fitz.Document = fitz.open(source)
     try:
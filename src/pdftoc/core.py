@@ -117,11 +117,16 @@ def _reuse_existing_bookmarks(
 
         if fix_bookmarks:
             print("Existing bookmarks appear incorrect, will regenerate")
-        else:
-            print(
-                "Warning: Existing bookmarks may be incorrect (use --fix to regenerate)"
-            )
-        return False
+            return False
+
+        # Without --fix, keep the document's own outline rather than falling
+        # through to extraction -- the most expensive stretch of the pipeline
+        # (text decode, regex scans, offset search) for a table the user asked
+        # to leave alone. The warning names the opt-in.
+        print("Warning: Existing bookmarks may be incorrect (use --fix to regenerate)")
+        shutil.copy(source, output)
+        print(f"Done! Output saved to: {reported_output}")
+        return True
     finally:
         doc.close()
 
@@ -175,15 +180,17 @@ def process_pdf(
     ):
         return
 
-    # Step 1: Check if OCR is needed
-    needs_ocr = not pdf_has_text(source)
+    # Step 1: Check if OCR is needed. One check only: each call reopens the
+    # document and decodes several pages of text.
+    has_text = pdf_has_text(source)
+    needs_ocr = not has_text
     if force_ocr:
         needs_ocr = True
     if skip_ocr:
         needs_ocr = False
 
     if verbose:
-        print(f"PDF has text: {pdf_has_text(source)}")
+        print(f"PDF has text: {has_text}")
         print(f"Will run OCR: {needs_ocr}")
 
     # Step 2: Extract text (OCR if needed)
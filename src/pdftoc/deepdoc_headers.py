@@ -339,4 +339,6 @@ def extract_section_headers_with_deepdoc(
     if verbose:
         print("Using legacy heuristic section header extraction...")
 
-    return extract_section_headers(doc, verbose, page_texts=page_texts)
+    return extract_section_headers(
+        doc, verbose, page_texts=page_texts, pdf_path=pdf_path
+    )
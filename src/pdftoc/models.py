@@ -23,7 +23,7 @@ class ExtractionMode(Enum):
     SECTION_HEADERS = "section-headers"  # Extract from section headers in content
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TocEntry:
     """A table of contents entry.
 
@@ -14,15 +14,19 @@ def pdf_has_text(pdf_path: Path) -> bool:
     """Check if a PDF already has extractable text."""
     doc: fitz.Document = fitz.open(pdf_path)
     try:
-        # Check first few pages for text
+        # Check first few pages for text, stopping at the threshold: a
+        # text-rich PDF usually clears it on page 1, so the later pages are
+        # only decoded for borderline (mostly-scanned) documents.
         pages_to_check = min(5, len(doc))
         total_text = 0
-        for i in range(pages_to_check):
-            page: fitz.Page = doc[i]
+        # pages() walks the page tree once instead of re-resolving doc[i].
+        for page in doc.pages(0, pages_to_check):
             text = page_text(page)
             total_text += len(text.strip())
-        # If we have a reasonable amount of text, assume it's OCR'd
-        return total_text > 100
+            # If we have a reasonable amount of text, assume it's OCR'd
+            if total_text > 100:
+                return True
+        return False
     finally:
         doc.close()
 
@@ -54,13 +58,26 @@ def run_ocr(
 
     if verbose:
         print(f"Running OCR: {' '.join(cmd)}")
-
-    # Run with live output so user sees progress bar
-    result = subprocess.run(cmd)
+        # Run with live output so user sees progress bar
+        result = subprocess.run(cmd)
+        if result.returncode != 0 and result.returncode != 6:
+            # Return code 6 means "file already has text" which is fine
+            # Don't add extra message - ocrmypdf already printed the error
+            raise RuntimeError("OCR failed (see error above)")
+        return
+
+    # Quiet run: ocrmypdf's progress output is pure terminal traffic, which
+    # is wasted (and slow to flush) when the user did not ask for it. Keep
+    # stderr captured so a failure can still say what went wrong.
+    result = subprocess.run(
+        [*cmd[:1], "--quiet", *cmd[1:]],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
     if result.returncode != 0 and result.returncode != 6:
-        # Return code 6 means "file already has text" which is fine
-        # Don't add extra message - ocrmypdf already printed the error
-        raise RuntimeError("OCR failed (see error above)")
+        detail = result.stderr.strip()
+        raise RuntimeError(f"OCR failed: {detail}" if detail else "OCR failed")
 
 
 def extract_text(
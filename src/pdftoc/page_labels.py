@@ -184,6 +184,9 @@ _MAX_ROMAN_PAGE = 100
 # Leading section number of a TOC title: "1.6.2 Integration to the Limit".
 _SECTION_NUM_RE = re.compile(r"^(\d+(?:\.\d+)*)[.\)]?\s+")
 
+# Words long enough to identify a section by.
+_TITLE_WORD_RE = re.compile(r"[A-Za-z]{4,}")
+
 # Words too common to identify a section by.
 _STOPWORDS = frozenset(
     {
@@ -245,8 +248,11 @@ def parse_page_label(value: object) -> tuple[int, PageRef] | None:
         return None
 
     text = value.strip()
-    if _FOLIO_RE.match(text):
-        return (int(text), PageRef.PRINTED_ARABIC) if int(text) > 0 else None
+    # Arabic digits are the common case by far; str.isdigit settles it without
+    # the regex engine. Same 4-digit cap as _FOLIO_RE, for the same reason.
+    if text.isdecimal():
+        page = int(text)
+        return (page, PageRef.PRINTED_ARABIC) if 0 < page <= 9999 else None
     if (roman := roman_to_int(text)) is not None and roman <= _MAX_ROMAN_PAGE:
         return roman, PageRef.PRINTED_ROMAN
     return None
@@ -301,40 +307,52 @@ def offset_from_folios(
 
 
 def _probe_terms(title: str) -> tuple[str | None, tuple[str, ...]]:
-    """Split a TOC title into its section number and its distinctive words."""
+    """Split a TOC title into its section number and its distinctive words.
+
+    Words are deduplicated (first occurrence wins): coverage is computed as
+    unique matches over `len(words)`, so a title like "Step by Step Proofs"
+    must not count "step" twice in the denominator.
+    """
     match = _SECTION_NUM_RE.match(title.strip())
     section_num = match.group(1) if match else None
     rest = title[match.end() :] if match else title
     return section_num, tuple(
-        word.lower()
-        for word in re.findall(r"[A-Za-z]{4,}", rest)
-        if word.lower() not in _STOPWORDS
+        dict.fromkeys(
+            word
+            for word in (w.lower() for w in _TITLE_WORD_RE.findall(rest))
+            if word not in _STOPWORDS
+        )
     )
 
 
-def _score_page(text: str, section_num: str | None, words: Sequence[str]) -> float:
+def _score_page(lowered: str, probe: _Probe) -> float:
     """Score how much a page looks like the *start* of a given section.
 
+    `lowered` is the page text already lowercased -- the caller caches that,
+    since the same page is scored by many probes at many offsets.
+
     Substring matching alone is far too weak — a chapter's running header
     repeats its title on every page of the chapter. Position matters: a real
     section start has the title near the top, ideally next to its number.
     """
-    if not words:
+    if not probe.words:
         return 0.0
 
-    lowered = text.lower()
     # Heading zone: the top of the page, where a section title would appear.
     heading = lowered[: max(400, len(lowered) // 4)]
 
-    hits = sum(1 for w in words if re.search(rf"\b{re.escape(w)}\b", lowered))
-    coverage = hits / len(words)
+    # One alternation pass over the page instead of one scan per word: the
+    # same probe is scored against every candidate offset, so the scan count
+    # is what dominates.
+    found = set(probe.words_re.findall(lowered))
+    coverage = len(found) / len(probe.words)
     if coverage < 0.75:  # require nearly all distinctive words to be present
         return 0.0
 
     score = coverage
-    if all(re.search(rf"\b{re.escape(w)}\b", heading) for w in words):
+    if len(set(probe.words_re.findall(heading))) == len(probe.words):
         score += 1.0  # the words appear together near the top
-    if section_num and re.search(rf"(?<!\d){re.escape(section_num)}(?!\d)", heading):
+    if probe.section_re is not None and probe.section_re.search(heading):
         score += 2.0  # numbered heading in the heading zone: strongest signal
     return score
 
@@ -346,6 +364,10 @@ class _Probe:
     printed_page: int
     section_num: str | None
     words: tuple[str, ...]
+    # Matches any distinctive word; compiled once per probe, scanned per page.
+    words_re: re.Pattern[str]
+    # Matches the section number outside a longer run of digits, if any.
+    section_re: re.Pattern[str] | None
 
 
 def _select_probes(
@@ -362,7 +384,15 @@ def _select_probes(
             continue
         section_num, words = _probe_terms(title)
         if words:  # need at least one distinctive word
-            probes.append(_Probe(printed, section_num, words))
+            words_re = re.compile(
+                r"\b(?:" + "|".join(re.escape(w) for w in words) + r")\b"
+            )
+            section_re = (
+                re.compile(rf"(?<!\d){re.escape(section_num)}(?!\d)")
+                if section_num
+                else None
+            )
+            probes.append(_Probe(printed, section_num, words, words_re, section_re))
 
     if len(probes) <= max_probes:
         return tuple(probes)
@@ -372,7 +402,7 @@ def _select_probes(
 
 def _endorsed_offsets(
     probe: _Probe,
-    page_text: Callable[[int], str],
+    lowered_text: Callable[[int], str],
     total_pages: int,
     skip_pages: frozenset[int],
     search_range: tuple[int, int],
@@ -388,7 +418,7 @@ def _endorsed_offsets(
         pdf_page = probe.printed_page + offset
         if not (1 <= pdf_page <= total_pages) or pdf_page in skip_pages:
             continue
-        score = _score_page(page_text(pdf_page), probe.section_num, probe.words)
+        score = _score_page(lowered_text(pdf_page), probe)
         if score > 0:
             scored.append((offset, score))
 
@@ -418,28 +448,53 @@ def offset_from_keywords(
 
     Returns:
         `(offset, agreement, probes_used)`, or None if no probe matched.
-        `agreement` is the fraction of probes endorsing the winning offset.
+        `agreement` is the fraction of the probes actually consulted that
+        endorse the winning offset; a decisive early lead means later probes
+        are never scanned.
     """
     probes = _select_probes(titled_pages, max_probes)
     if not probes:
         return None
 
+    # Lower each page once here rather than per score: probes overlap heavily
+    # in the pages their offset ranges cover, and `str.lower` on a full page
+    # is an allocation worth not repeating.
+    lowered_cache: dict[int, str] = {}
+
+    def lowered_text(pdf_page: int) -> str:
+        lowered = lowered_cache.get(pdf_page)
+        if lowered is None:
+            lowered = page_text(pdf_page).lower()
+            lowered_cache[pdf_page] = lowered
+        return lowered
+
     votes: Counter[int] = Counter()
     weights: defaultdict[int, float] = defaultdict(float)
+    probes_used = 0
     for probe in probes:
+        probes_used += 1
         for offset, score in _endorsed_offsets(
-            probe, page_text, total_pages, skip_pages, search_range
+            probe, lowered_text, total_pages, skip_pages, search_range
         ):
             votes[offset] += 1
             weights[offset] += score
 
+        # Stop early once the leader cannot be caught: each remaining probe
+        # adds at most one vote per offset, so a lead wider than the probes
+        # left settles the winner without scanning their full offset ranges.
+        ranked = votes.most_common(2)
+        if ranked:
+            lead = ranked[0][1] - (ranked[1][1] if len(ranked) > 1 else 0)
+            if lead > len(probes) - probes_used:
+                break
+
     if not votes:
         return None
 
     # Most endorsing probes wins; break ties on total score, then on the
     # smaller shift (front matter is usually short).
     offset = min(votes, key=lambda o: (-votes[o], -weights[o], abs(o)))
-    return offset, votes[offset] / len(probes), len(probes)
+    return offset, votes[offset] / probes_used, probes_used
 
 
 def _unambiguous_folios(
@@ -10,7 +10,12 @@ import fitz  # type: ignore
 
 __all__ = ["page_text"]
 
+# Everything downstream wants a flat string for matching, so skip the work the
+# default flags do for display: ligatures come back expanded ("fi", not "ﬁ"),
+# which is also what keyword and regex matching expect to see.
+_TEXT_FLAGS = fitz.TEXTFLAGS_TEXT & ~fitz.TEXT_PRESERVE_LIGATURES
+
 
 def page_text(page: fitz.Page) -> str:
     """The plain text of a page."""
-    return str(page.get_text())
+    return str(page.get_text("text", flags=_TEXT_FLAGS))
@@ -1,19 +1,97 @@
 """Section header extraction using NLP heuristics."""
 
+import math
+import os
 import re
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
 from pathlib import Path
 
 import fitz  # type: ignore
-import yaml
 
 from pdftoc.models import TocEntry
 from pdftoc.page_labels import PageRef
 from pdftoc.pdf_text import page_text
 
+# Compiled once: the scorer and the pattern matcher run against every candidate
+# line of every page, so none of these should pay the regex-cache lookup
+# per call.
+
+# Section numbering shapes, fused into one alternation so a line is matched
+# in a single engine call. Alternation order is the old priority order
+# (chapter, then deepest numbering first); equivalence holds because a line
+# one shape matches but its guard rejects never matches a later shape either.
+# IGNORECASE only has letters to act on in the chapter arm.
+_SECTION_PATTERN_RE = re.compile(
+    r"^(?:(?P<chapter>Chapter)\s+(?P<chapter_num>\d+)[:\s]+(?P<chapter_title>.+)"
+    r"|(?P<subsub_num>\d+\.\d+\.\d+)\s+(?P<subsub_title>.+)"
+    r"|(?P<sub_num>\d+\.\d+)\s+(?P<sub_title>.+)"
+    r"|(?P<sec_num>\d{1,2})\.?\s+(?P<sec_title>.+))$",
+    re.IGNORECASE,
+)
+
+# Line-combination helpers: a bare section number, and a title-looking line.
+_SEC_NUM_ONLY_RE = re.compile(r"^\d+(\.\d+)*$")
+_TITLE_START_RE = re.compile(r"^[A-Z][A-Za-z]")
+
+# Scoring helpers.
+_WORD_RE = re.compile(r"[a-zA-Z]+")
+_LEADING_NUM_RE = re.compile(r"^\d+\.?\s*")
+# Title case: every word starts uppercase or is a lowercase connective. Each
+# connective must be a whole word (followed by whitespace or end of string).
+_TITLE_CASE_RE = re.compile(
+    r"^(?:(?:[A-Z]\S*|(?i:a|an|the|of|and|in|on|for|to|with))(?:\s+|$))+$"
+)
+_SEC_NUM_HEAD_RE = re.compile(r"^(\d+)\.")
+
+# Negative patterns. Reference entries ("3. Smith, ...") and author lists
+# ("1. A. B. Name") share a prefix and are mutually exclusive, so one pattern
+# covers both. Publication boilerplate stays separate: it can co-occur with a
+# reference line, and the two penalties are meant to stack.
+_REF_OR_AUTHOR_RE = re.compile(r"^\d+\.\s+[A-Z](?:[a-z]*\s*,|\.\s+[A-Z])")
+_PUBLICATION_RE = re.compile(r"ACM|IEEE|Springer|©|\d{4}[-/]\d{2,4}")
+
+
+# Below this, thread-pool overhead eats the win from overlapping extraction.
+_PARALLEL_SCAN_MIN_PAGES = 50
+
+
+def _page_texts_parallel(pdf_path: Path, total: int) -> list[str]:
+    """Every page's text, extracted with per-worker document handles.
+
+    MuPDF releases the GIL during extraction, so threads genuinely overlap --
+    but a `Document` handle must not be shared across threads, so each worker
+    opens its own handle on `pdf_path` and reads a contiguous slice.
+    """
+    workers = min(8, os.cpu_count() or 4)
+
+    def scan(span: range) -> list[tuple[int, str]]:
+        local: fitz.Document = fitz.open(pdf_path)
+        try:
+            return [(i, page_text(local[i])) for i in span]
+        finally:
+            local.close()
+
+    per_worker = math.ceil(total / workers)
+    spans = [
+        range(start, min(start + per_worker, total))
+        for start in range(0, total, per_worker)
+    ]
+    texts: list[str] = [""] * total
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for chunk in pool.map(scan, spans):
+            for i, text in chunk:
+                texts[i] = text
+    return texts
+
 
 def _load_word_list(filename: str) -> set[str]:
     """Load a word list from a YAML file in the data directory."""
+    # PyYAML is slow to import and only these two cached loaders need it, so
+    # it stays off the module import path.
+    import yaml
+
     data_dir = Path(__file__).parent / "data"
     filepath = data_dir / filename
     with filepath.open() as f:
@@ -37,6 +115,7 @@ def extract_section_headers(
     doc: fitz.Document,
     verbose: bool,
     page_texts: dict[int, str] | None = None,
+    pdf_path: Path | None = None,
 ) -> list[TocEntry]:
     """
     Extract TOC entries by scanning document for section headers.
@@ -52,6 +131,9 @@ def extract_section_headers(
         doc: PyMuPDF document (used for page count and fallback text).
         verbose: Whether to print debug info.
         page_texts: Optional pre-extracted text per page {1-indexed: text}.
+        pdf_path: Path to the document on disk. With a path, long documents
+            are extracted on a thread pool (per-worker handles); without one,
+            the scan stays serial.
     """
     toc_entries: list[TocEntry] = []
     seen: set[tuple[str, int]] = set()
@@ -59,12 +141,17 @@ def extract_section_headers(
     if verbose:
         print("Scanning document for section headers...")
 
-    for page_idx in range(len(doc)):
-        if page_texts is not None:
-            text = page_texts.get(page_idx + 1, "")
-        else:
-            page: fitz.Page = doc[page_idx]
-            text = page_text(page)
+    texts: Iterable[tuple[int, str]]
+    if page_texts is not None:
+        texts = ((i, page_texts.get(i + 1, "")) for i in range(len(doc)))
+    elif pdf_path is not None and len(doc) >= _PARALLEL_SCAN_MIN_PAGES:
+        texts = enumerate(_page_texts_parallel(pdf_path, len(doc)))
+    else:
+        # Iterating the document walks the page tree once instead of
+        # re-resolving doc[i] per page.
+        texts = ((i, page_text(page)) for i, page in enumerate(doc))
+
+    for page_idx, text in texts:
         lines = [line.strip() for line in text.split("\n")]
 
         i = 0
@@ -74,6 +161,15 @@ def extract_section_headers(
                 i += 1
                 continue
 
+            # Every shape the matcher knows starts with a digit or with
+            # "Chapter"/"chapter", and the combine-with-next-line path needs a
+            # digit start too -- so any other first character cannot yield an
+            # entry. One character test skips the scorer for most body text.
+            first = line[0]
+            if not (first.isdecimal() or first in "Cc"):
+                i += 1
+                continue
+
             # Score and match section header
             score, entry = _score_section_header(line, page_idx + 1)
 
@@ -82,11 +178,7 @@ def extract_section_headers(
             if not entry and i + 1 < len(lines):
                 next_line = lines[i + 1]
                 # Current line is just a number (potential section number)
-                if (
-                    next_line
-                    and len(next_line) < 80
-                    and re.match(r"^\d+(\.\d+)*$", line)
-                ):
+                if next_line and len(next_line) < 80 and _SEC_NUM_ONLY_RE.match(line):
                     # Skip if this looks like a page number header/footer
                     # (single number at very top or bottom of page)
                     is_likely_page_number = False
@@ -107,7 +199,7 @@ def extract_section_headers(
                         continue
 
                     # Only combine if next line looks like a title (starts with capital)
-                    if re.match(r"^[A-Z][A-Za-z]", next_line):
+                    if _TITLE_START_RE.match(next_line):
                         combined = f"{line} {next_line}"
                         score, entry = _score_section_header(combined, page_idx + 1)
                         if entry and score >= 0.4:
@@ -160,8 +252,9 @@ def _score_section_header(
     body_starters = _get_body_text_starters()
 
     # === Academic vocabulary heuristic (0.0 - 0.35 points) ===
-    # This is our strongest signal for academic papers
-    title_words = {w.lower() for w in re.findall(r"[a-zA-Z]+", entry.title)}
+    # This is our strongest signal for academic papers. Lower the title once
+    # and tokenize the lowered copy: one allocation instead of one per word.
+    title_words = set(_WORD_RE.findall(entry.title.lower()))
     academic_matches = title_words & academic_vocabulary
     if academic_matches:
         # More matches = higher confidence
@@ -169,23 +262,15 @@ def _score_section_header(
         score += vocab_boost
 
     # === Title structure heuristics ===
-    title_part = re.sub(r"^\d+\.?\s*", "", entry.title).strip()
+    title_part = _LEADING_NUM_RE.sub("", entry.title).strip()
 
     # Boost for ALL CAPS titles (common in older papers)
     if title_part.isupper() and len(title_part) > 3:
         score += 0.2
 
     # Boost for title case (first letter of significant words capitalized)
-    elif title_part and title_part[0].isupper():
-        words = title_part.split()
-        if len(words) >= 1 and all(
-            w[0].isupper()
-            or w.lower()
-            in {"a", "an", "the", "of", "and", "in", "on", "for", "to", "with"}
-            for w in words
-            if w
-        ):
-            score += 0.1
+    elif title_part and title_part[0].isupper() and _TITLE_CASE_RE.match(title_part):
+        score += 0.1
 
     # Penalize titles ending with sentence punctuation (except colon for subtitles)
     if title_part.endswith((".", ",", ";")):
@@ -201,28 +286,22 @@ def _score_section_header(
         score -= 0.2
 
     # === Negative patterns (strong rejection) ===
-    # References pattern: "N. AUTHOR, ..." or "N. Name,"
-    if re.match(r"^\d+\.\s+[A-Z][a-z]*\s*,", line):
+    # Reference entries ("N. AUTHOR, ..." / "N. Name,") and author lists
+    # ("N. A. B. Name"): one match, same penalty either way.
+    if _REF_OR_AUTHOR_RE.match(line):
         score -= 0.5
 
     # Body text starters - these strongly indicate body text, not headers
-    first_word = title_part.split()[0].lower() if title_part else ""
+    first_word = title_part.split(maxsplit=1)[0].lower() if title_part else ""
     if first_word in body_starters:
         score -= 0.3
 
-    # === Additional negative patterns ===
-    # Author patterns: "N. A. Name and B. Name" or "N. Firstname Lastname"
-    if re.match(
-        r"^\d+\.\s+[A-Z]\.\s+[A-Z]", line
-    ):  # "1. A. B. Name" or "1. K. Matsuda"
-        score -= 0.5
-
     # Copyright/publication patterns
-    if re.search(r"ACM|IEEE|Springer|©|\d{4}[-/]\d{2,4}", line):
+    if _PUBLICATION_RE.search(line):
         score -= 0.5
 
     # Reference numbers typically > 15
-    sec_num_match = re.match(r"^(\d+)\.", entry.title)
+    sec_num_match = _SEC_NUM_HEAD_RE.match(entry.title)
     if sec_num_match:
         sec_num = int(sec_num_match.group(1))
         if sec_num > 15:  # Very unlikely to have 15+ main sections
@@ -235,13 +314,14 @@ def _score_section_header(
 
 def _try_match_section_pattern(line: str, page_num: int) -> TocEntry | None:
     """Try to match a line against section numbering patterns."""
-    # Pattern: "Chapter N: Title" or "CHAPTER N Title"
-    chapter_match = re.match(
-        r"^(Chapter|CHAPTER)\s+(\d+)[:\s]+(.+)$", line, re.IGNORECASE
-    )
-    if chapter_match:
-        num = chapter_match.group(2)
-        title = chapter_match.group(3).strip()
+    match = _SECTION_PATTERN_RE.match(line)
+    if not match:
+        return None
+
+    # "Chapter N: Title" or "CHAPTER N Title"
+    if match.group("chapter") is not None:
+        num = match.group("chapter_num")
+        title = match.group("chapter_title").strip()
         if title and len(title) > 2:
             return TocEntry(
                 level=1,
@@ -249,35 +329,31 @@ def _try_match_section_pattern(line: str, page_num: int) -> TocEntry | None:
                 page=page_num,
                 page_ref=PageRef.PDF,
             )
+        return None
 
-    # Pattern: "N.N.N Title" (sub-subsection)
-    subsubsec_match = re.match(r"^(\d+\.\d+\.\d+)\s+(.+)$", line)
-    if subsubsec_match:
-        num = subsubsec_match.group(1)
-        title = subsubsec_match.group(2).strip()
+    # "N.N.N Title" (sub-subsection)
+    if (num := match.group("subsub_num")) is not None:
+        title = match.group("subsub_title").strip()
         if len(title) >= 3:
             return TocEntry(
                 level=4, title=f"{num} {title}", page=page_num, page_ref=PageRef.PDF
             )
+        return None
 
-    # Pattern: "N.N Title" (subsection)
-    subsec_match = re.match(r"^(\d+\.\d+)\s+(.+)$", line)
-    if subsec_match:
-        num = subsec_match.group(1)
-        title = subsec_match.group(2).strip()
+    # "N.N Title" (subsection)
+    if (num := match.group("sub_num")) is not None:
+        title = match.group("sub_title").strip()
         if len(title) >= 3:
             return TocEntry(
                 level=3, title=f"{num} {title}", page=page_num, page_ref=PageRef.PDF
             )
-
-    # Pattern: "N. Title" or "N Title" (main section)
-    sec_match = re.match(r"^(\d{1,2})\.?\s+(.+)$", line)
-    if sec_match:
-        num = sec_match.group(1)
-        title = sec_match.group(2).strip()
-        if len(title) >= 3 and int(num) <= 20:
-            return TocEntry(
-                level=2, title=f"{num}. {title}", page=page_num, page_ref=PageRef.PDF
-            )
-
+        return None
+
+    # "N. Title" or "N Title" (main section)
+    num = match.group("sec_num")
+    title = match.group("sec_title").strip()
+    if len(title) >= 3 and int(num) <= 20:
+        return TocEntry(
+            level=2, title=f"{num}. {title}", page=page_num, page_ref=PageRef.PDF
+        )
     return None
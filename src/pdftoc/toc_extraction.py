@@ -20,9 +20,34 @@ _TOC_INDICATORS = (
     "目次",
 )
 
+# One case-insensitive search instead of lowercasing the whole page first:
+# the detector runs over up to 30 pages, and the .lower() copy was the only
+# reason the page text was duplicated.
+_TOC_INDICATOR_RE = re.compile(
+    "|".join(re.escape(marker) for marker in _TOC_INDICATORS), re.IGNORECASE
+)
+
 # How far into a book to look. Front matter is occasionally long.
 _TOC_SEARCH_PAGES = 30
 
+# Line-shape patterns, compiled once: the line-by-line parser runs several of
+# these against every line of every contents page, and the page detector runs
+# one per line of every candidate page.
+_ROMAN_ONLY_RE = re.compile(r"^[IVXivx]+$")
+_PART_ROMAN_RE = re.compile(r"^([IVX]+)$", re.IGNORECASE)
+_SUBSEC_NUM_RE = re.compile(r"^(\d+(?:\.\d+)+)$")
+_INLINE_SUBSEC_RE = re.compile(r"^(\d+(?:\.\d+)+)\s+(.+)$")
+_INLINE_SEC_RE = re.compile(r"^(\d{1,2})\s+([A-Z].{2,})$")
+_SIMPLE_TITLE_RE = re.compile(r"^[A-Z][A-Za-z\s,\-:]+$")
+_DENSE_SECTION_RE = re.compile(r"(?:^|\s)\d+\.\d+(?:\.\d+)?\s")
+
+# Header/footer noise the line-by-line parser skips outright. Roman numerals
+# alone are deliberately absent: they double as part numbers. The headings are
+# a set lookup rather than regexes -- this check runs once per line -- leaving
+# only the date shape ("February 2, 2010") to the regex engine.
+_SKIP_LINE_EXACT = frozenset({"content", "contents", "table of contents"})
+_SKIP_DATE_RE = re.compile(r"^\w+\s+\d+,\s+\d{4}$")
+
 
 def find_toc_pages(
     doc: fitz.Document,
@@ -37,25 +62,32 @@ def find_toc_pages(
     """
     toc_pages: list[tuple[int, str]] = []
 
-    for i in range(min(_TOC_SEARCH_PAGES, len(doc))):
-        if page_texts is not None:
-            text = page_texts.get(i + 1, "")
-        else:
-            page: fitz.Page = doc[i]
-            text = page_text(page)
+    limit = min(_TOC_SEARCH_PAGES, len(doc))
+    if page_texts is not None:
+        texts = ((i, page_texts.get(i + 1, "")) for i in range(limit))
+    else:
+        # pages() walks the page tree once instead of re-resolving doc[i].
+        texts = ((i, page_text(page)) for i, page in enumerate(doc.pages(0, limit)))
 
-        lowered = text.lower()
-        is_toc_page = any(marker in lowered for marker in _TOC_INDICATORS)
+    for i, text in texts:
+        is_toc_page = _TOC_INDICATOR_RE.search(text) is not None
 
         # A column of bare numbers is the page-reference column of a contents.
-        lines = text.strip().split("\n")
-        if sum(1 for line in lines if re.match(r"^\d+$", line.strip())) >= 5:
-            is_toc_page = True
+        # Stop at the fifth hit -- and skip the count entirely when the page
+        # already announced itself.
+        if not is_toc_page:
+            number_lines = 0
+            for line in text.splitlines():
+                if line.strip().isdecimal():
+                    number_lines += 1
+                    if number_lines >= 5:
+                        is_toc_page = True
+                        break
 
         # A continuation page rarely repeats the heading, so once the contents
         # has started, dense section numbering is enough to stay in it.
         if not is_toc_page and toc_pages:
-            is_toc_page = len(re.findall(r"(?:^|\s)\d+\.\d+(?:\.\d+)?\s", text)) >= 3
+            is_toc_page = len(_DENSE_SECTION_RE.findall(text)) >= 3
 
         if is_toc_page:
             toc_pages.append((i, text))
@@ -198,11 +230,16 @@ _CODE_CHARS = re.compile(r"[{}\[\]=;<>@#$]")
 # A division marker is a complete title on its own: "Part I" needs no name.
 _DIVISION_ONLY = re.compile(r"^\s*(?:chapter|part|appendix)\b", re.IGNORECASE)
 
+# Leading keyword and numbering stripped off a candidate title before judging
+# what remains.
+_TITLE_KEYWORD = re.compile(r"^\s*(?:chapter|part|section)\s+", re.IGNORECASE)
+_TITLE_NUMBERING = re.compile(r"^\s*[\dIVXivx]+(?:\.\d+)*\s*[.):]?\s*")
+
 
 def _is_plausible_title(title: str) -> bool:
     """Whether a captured title reads like a section name rather than debris."""
-    body = re.sub(r"^\s*(?:chapter|part|section)\s+", "", title, flags=re.IGNORECASE)
-    body = re.sub(r"^\s*[\dIVXivx]+(?:\.\d+)*\s*[.):]?\s*", "", body).strip()
+    body = _TITLE_KEYWORD.sub("", title)
+    body = _TITLE_NUMBERING.sub("", body).strip()
 
     if body.lower().strip(".:") in _BOILERPLATE_TITLES:
         return False
@@ -220,96 +257,100 @@ def _is_plausible_title(title: str) -> bool:
     return len(_CODE_CHARS.findall(body)) == 0
 
 
-def _extract_dotted_leader_format(
-    toc_text: str, total_pages: int, verbose: bool
-) -> list[TocEntry]:
-    """Extract TOC using dotted leader patterns (Title ... page)."""
-    toc_entries: list[TocEntry] = []
-    seen: set[tuple[str, int]] = set()
-
-    patterns = [
-        # "Chapter 1: Title ... 15", and the same entry with its page on the
-        # next line instead. A keyword-led line needs no leader dots to be
-        # unambiguous, and plenty of books print none -- one puts barely two
-        # whitespace characters between title and page, one short of the run
-        # the dotted form demands, which dropped every chapter it had.
-        (
-            re.compile(
-                rf"^(Chapter|CHAPTER)\s+(\d+)[:.\s]{{1,2}}{_LABEL_GAP}"
-                rf"([^\n]+?){_PAGE_GAP}(\d{{1,4}})[ \t]*$",
-                re.MULTILINE,
-            ),
-            "chapter",
+# The dotted-leader pattern table, built once at import: every pattern runs a
+# findall over the full contents text on every extraction, so there is no
+# reason to rebuild the table (and re-hit the regex cache) per call.
+_DOTTED_LEADER_PATTERNS: list[tuple[re.Pattern[str], str]] = [
+    # "Chapter 1: Title ... 15", and the same entry with its page on the
+    # next line instead. A keyword-led line needs no leader dots to be
+    # unambiguous, and plenty of books print none -- one puts barely two
+    # whitespace characters between title and page, one short of the run
+    # the dotted form demands, which dropped every chapter it had.
+    (
+        re.compile(
+            rf"^(Chapter|CHAPTER)\s+(\d+)[:.\s]{{1,2}}{_LABEL_GAP}"
+            rf"([^\n]+?){_PAGE_GAP}(\d{{1,4}})[ \t]*$",
+            re.MULTILINE,
         ),
-        # "Part I: Title ... 5"
-        (
-            re.compile(
-                rf"^(Part|PART)\s+([IVX\d]+)[:.\s]{{1,2}}{_LABEL_GAP}"
-                rf"([^\n]+?){_PAGE_GAP}(\d{{1,4}})[ \t]*$",
-                re.MULTILINE,
-            ),
-            "part",
+        "chapter",
+    ),
+    # "Part I: Title ... 5"
+    (
+        re.compile(
+            rf"^(Part|PART)\s+([IVX\d]+)[:.\s]{{1,2}}{_LABEL_GAP}"
+            rf"([^\n]+?){_PAGE_GAP}(\d{{1,4}})[ \t]*$",
+            re.MULTILINE,
         ),
-        # "1.1.1 Title ... 15", "§1.1.1 Title / 15"
-        (
-            re.compile(
-                rf"^{_SECTION_MARK}(\d+\.\d+\.\d+)\.?{_LABEL_GAP}"
-                rf"([^\n]+?){_PAGE_GAP}(\d{{1,4}})[ \t]*$",
-                re.MULTILINE,
-            ),
-            "subsub",
+        "part",
+    ),
+    # "1.1.1 Title ... 15", "§1.1.1 Title / 15"
+    (
+        re.compile(
+            rf"^{_SECTION_MARK}(\d+\.\d+\.\d+)\.?{_LABEL_GAP}"
+            rf"([^\n]+?){_PAGE_GAP}(\d{{1,4}})[ \t]*$",
+            re.MULTILINE,
         ),
-        # "1.1 Title ... 15", "§1.1. Title / 15"
-        (
-            re.compile(
-                rf"^{_SECTION_MARK}(\d+\.\d+)\.?{_LABEL_GAP}"
-                rf"([^\n]+?){_PAGE_GAP}(\d{{1,4}})[ \t]*$",
-                re.MULTILINE,
-            ),
-            "sub",
+        "subsub",
+    ),
+    # "1.1 Title ... 15", "§1.1. Title / 15"
+    (
+        re.compile(
+            rf"^{_SECTION_MARK}(\d+\.\d+)\.?{_LABEL_GAP}"
+            rf"([^\n]+?){_PAGE_GAP}(\d{{1,4}})[ \t]*$",
+            re.MULTILINE,
         ),
-        # "1. Title ... 15"
-        (
-            re.compile(
-                r"^(\d+)[\.\)]\s+(.+?)\s*[\.…·\-_\s]{3,}\s*(\d+)\s*$",
-                re.MULTILINE,
-            ),
-            "numbered",
+        "sub",
+    ),
+    # "1. Title ... 15"
+    (
+        re.compile(
+            r"^(\d+)[\.\)]\s+(.+?)\s*[\.…·\-_\s]{3,}\s*(\d+)\s*$",
+            re.MULTILINE,
         ),
-        # Chapter line carrying no keyword, no dot after the number and no
-        # leader dots. Every other pattern here relies on leader dots to find
-        # the page, and a chapter line often has none -- which silently dropped
-        # every chapter of a book whose sections (which do have leaders) came
-        # through fine.
-        #
-        # Two layouts, because extraction groups the number with the title only
-        # when it is wide enough to sit in the same span. They get separate
-        # patterns because they carry different risk.
-        #
-        # Number sharing the title's line -- "311 Boolean algebras / 13".
-        # Unambiguous: a page number is never followed by prose on its own line,
-        # so this tolerates the three-digit part numbering some series use.
-        (
-            re.compile(
-                r"^(\d{1,3})[ \t]+([A-Z][^\n]{2,}?)[\.…·\-_ ]*\n(\d{1,4})[ \t]*$",
-                re.MULTILINE,
-            ),
-            "chapter_bare",
+        "numbered",
+    ),
+    # Chapter line carrying no keyword, no dot after the number and no
+    # leader dots. Every other pattern here relies on leader dots to find
+    # the page, and a chapter line often has none -- which silently dropped
+    # every chapter of a book whose sections (which do have leaders) came
+    # through fine.
+    #
+    # Two layouts, because extraction groups the number with the title only
+    # when it is wide enough to sit in the same span. They get separate
+    # patterns because they carry different risk.
+    #
+    # Number sharing the title's line -- "311 Boolean algebras / 13".
+    # Unambiguous: a page number is never followed by prose on its own line,
+    # so this tolerates the three-digit part numbering some series use.
+    (
+        re.compile(
+            r"^(\d{1,3})[ \t]+([A-Z][^\n]{2,}?)[\.…·\-_ ]*\n(\d{1,4})[ \t]*$",
+            re.MULTILINE,
         ),
-        # Number alone on its line -- "1 / Odds and ends / 1". A bare number is
-        # indistinguishable from the *previous* entry's page number, so this
-        # shape is held to one or two digits: a lone three-digit line in a
-        # contents is far more often a page than a chapter.
-        (
-            re.compile(
-                r"^(\d{1,2})\n([A-Z][^\n]{2,}?)[\.…·\-_ ]*\n(\d{1,4})[ \t]*$",
-                re.MULTILINE,
-            ),
-            "chapter_bare",
+        "chapter_bare",
+    ),
+    # Number alone on its line -- "1 / Odds and ends / 1". A bare number is
+    # indistinguishable from the *previous* entry's page number, so this
+    # shape is held to one or two digits: a lone three-digit line in a
+    # contents is far more often a page than a chapter.
+    (
+        re.compile(
+            r"^(\d{1,2})\n([A-Z][^\n]{2,}?)[\.…·\-_ ]*\n(\d{1,4})[ \t]*$",
+            re.MULTILINE,
         ),
-    ]
+        "chapter_bare",
+    ),
+]
 
-    for pattern, ptype in patterns:
+
+def _extract_dotted_leader_format(
+    toc_text: str, total_pages: int, verbose: bool
+) -> list[TocEntry]:
+    """Extract TOC using dotted leader patterns (Title ... page)."""
+    toc_entries: list[TocEntry] = []
+    seen: set[tuple[str, int]] = set()
+
+    for pattern, ptype in _DOTTED_LEADER_PATTERNS:
         for match in pattern.findall(toc_text):
             if ptype in ("chapter", "part"):
                 prefix, num, title, page_str = match
@@ -365,23 +406,20 @@ def _extract_line_by_line_format(
     Core Concepts
     7
     """
-    toc_entries: list[TocEntry] = []
-    lines = [line.strip() for line in toc_text.split("\n") if line.strip()]
-
-    # Filter out header/footer noise
-    skip_patterns = [
-        r"^contents?$",
-        r"^table of contents$",
-        r"^\w+\s+\d+,\s+\d{4}$",  # Date like "February 2, 2010"
-        r"^[ivxlc]+$",  # Roman numerals alone (but keep as potential part numbers)
-    ]
+    # Insertion-ordered dict keyed like the old trailing dedup pass, so
+    # duplicates are dropped as they appear instead of in a second walk over
+    # the full entry list.
+    unique: dict[tuple[str, int, PageRef], TocEntry] = {}
+    # splitlines + walrus: one strip per line instead of two, no trailing
+    # empty-string artifact to filter.
+    lines = [stripped for line in toc_text.splitlines() if (stripped := line.strip())]
 
     i = 0
     while i < len(lines):
         line = lines[i]
 
-        # Skip noise
-        if any(re.match(p, line, re.IGNORECASE) for p in skip_patterns[:3]):
+        # Skip header/footer noise
+        if line.lower() in _SKIP_LINE_EXACT or _SKIP_DATE_RE.match(line):
             i += 1
             continue
 
@@ -400,21 +438,15 @@ def _extract_line_by_line_format(
             # them, and re-parsing from the middle of it only invents worse
             # entries.
             if _is_plausible_title(entry[0].title):
-                toc_entries.append(entry[0])
+                parsed = entry[0]
+                unique.setdefault(
+                    (parsed.title.lower(), parsed.page, parsed.page_ref), parsed
+                )
             i = entry[1]
         else:
             i += 1
 
-    # Deduplicate
-    seen: set[tuple[str, int, PageRef]] = set()
-    unique_entries: list[TocEntry] = []
-    for entry in toc_entries:
-        key = (entry.title.lower(), entry.page, entry.page_ref)
-        if key not in seen:
-            seen.add(key)
-            unique_entries.append(entry)
-
-    return unique_entries
+    return list(unique.values())
 
 
 def _try_parse_toc_entry(
@@ -426,42 +458,42 @@ def _try_parse_toc_entry(
 
     line = lines[idx]
 
+    # The line after the label is probed by several arms -- as a title in
+    # some, as a page number in others -- with the same two classification
+    # questions; answer them once.
+    next_line = lines[idx + 1] if idx + 1 < len(lines) else ""
+    next_is_num = next_line.isdecimal()
+    next_is_roman = bool(_ROMAN_ONLY_RE.match(next_line))
+
     # Check for chapter/section number pattern: just a number like "1", "2", "10"
-    chapter_num_match = re.match(r"^(\d+)$", line)
-    if chapter_num_match and idx + 2 < len(lines):
-        num = chapter_num_match.group(1)
+    if line.isdecimal() and idx + 2 < len(lines):
+        num = line
         # Next line should be title, line after should be page number
-        title_line = lines[idx + 1]
         page_line = lines[idx + 2]
 
         # Title should be text (not just a number)
-        if not re.match(r"^\d+$", title_line) and not re.match(
-            r"^[IVXivx]+$", title_line
-        ):
+        if not next_is_num and not next_is_roman:
             # Page could be number or roman numeral
             parsed = _parse_page_number(page_line, total_pages)
             if parsed is not None:
                 page, page_ref = parsed
-                title = f"{num}. {title_line}"
+                title = f"{num}. {next_line}"
                 return (
                     TocEntry(level=2, title=title, page=page, page_ref=page_ref),
                     idx + 3,
                 )
 
     # Check for Part pattern: Roman numeral like "I", "II", "III"
-    part_match = re.match(r"^([IVX]+)$", line, re.IGNORECASE)
+    part_match = _PART_ROMAN_RE.match(line)
     if part_match and idx + 2 < len(lines):
         roman = part_match.group(1).upper()
-        title_line = lines[idx + 1]
         page_line = lines[idx + 2]
 
-        if not re.match(r"^\d+$", title_line) and not re.match(
-            r"^[IVXivx]+$", title_line
-        ):
+        if not next_is_num and not next_is_roman:
             parsed = _parse_page_number(page_line, total_pages)
             if parsed is not None:
                 page, page_ref = parsed
-                title = f"Part {roman}: {title_line}"
+                title = f"Part {roman}: {next_line}"
                 return (
                     TocEntry(level=1, title=title, page=page, page_ref=page_ref),
                     idx + 3,
@@ -469,9 +501,8 @@ def _try_parse_toc_entry(
 
     # Check for simple "Title" followed by "page" pattern (e.g., "Preface" -> "ix")
     # Title should start with capital letter and be reasonable text
-    if re.match(r"^[A-Z][A-Za-z\s,\-:]+$", line) and idx + 1 < len(lines):
-        page_line = lines[idx + 1]
-        parsed = _parse_page_number(page_line, total_pages)
+    if _SIMPLE_TITLE_RE.match(line) and idx + 1 < len(lines):
+        parsed = _parse_page_number(next_line, total_pages)
         if parsed is not None:
             page, page_ref = parsed
             return (
@@ -480,30 +511,28 @@ def _try_parse_toc_entry(
             )
 
     # Check for subsection pattern: "1.1" or "1.2.3" (number only, title on next line)
-    subsec_match = re.match(r"^(\d+(?:\.\d+)+)$", line)
+    subsec_match = _SUBSEC_NUM_RE.match(line)
     if subsec_match and idx + 2 < len(lines):
         num = subsec_match.group(1)
-        title_line = lines[idx + 1]
         page_line = lines[idx + 2]
 
-        if not re.match(r"^\d+$", title_line):
+        if not next_is_num:
             parsed = _parse_page_number(page_line, total_pages)
             if parsed is not None:
                 page, page_ref = parsed
                 level = num.count(".") + 2  # 1.1 -> level 3, 1.1.1 -> level 4
-                title = f"{num} {title_line}"
+                title = f"{num} {next_line}"
                 return (
                     TocEntry(level=level, title=title, page=page, page_ref=page_ref),
                     idx + 3,
                 )
 
     # Check for "N.N.N Title" on same line, page on next line (marker OCR format)
-    inline_subsec = re.match(r"^(\d+(?:\.\d+)+)\s+(.+)$", line)
+    inline_subsec = _INLINE_SUBSEC_RE.match(line)
     if inline_subsec and idx + 1 < len(lines):
         num = inline_subsec.group(1)
         title = inline_subsec.group(2).strip()
-        page_line = lines[idx + 1]
-        parsed = _parse_page_number(page_line, total_pages)
+        parsed = _parse_page_number(next_line, total_pages)
         if parsed is not None and len(title) >= 3:
             page, page_ref = parsed
             level = num.count(".") + 2
@@ -516,12 +545,11 @@ def _try_parse_toc_entry(
 
     # Check for "N Title" on same line, page on next line (marker OCR format)
     # e.g., "2 Signal Processing Fundamentals" / "21"
-    inline_sec = re.match(r"^(\d{1,2})\s+([A-Z].{2,})$", line)
+    inline_sec = _INLINE_SEC_RE.match(line)
     if inline_sec and idx + 1 < len(lines):
         num = inline_sec.group(1)
         title = inline_sec.group(2).strip()
-        page_line = lines[idx + 1]
-        parsed = _parse_page_number(page_line, total_pages)
+        parsed = _parse_page_number(next_line, total_pages)
         if parsed is not None and int(num) <= 20:
             page, page_ref = parsed
             return (
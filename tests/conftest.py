@@ -2,11 +2,14 @@
 
 import shutil
 import sys
+from collections.abc import Callable, Iterator
+from functools import cache, lru_cache
 from pathlib import Path
 
 # Add tests directory to path so pdf_test_cases can be imported
 sys.path.insert(0, str(Path(__file__).parent))
 
+import fitz  # type: ignore
 import pytest
 
 from pdf_test_cases import (
@@ -21,8 +24,13 @@ from pdf_test_cases import (
 # ============================================================================
 
 
+@lru_cache(maxsize=1)
 def is_tesseract_available() -> bool:
-    """Check if Tesseract OCR is available on the system."""
+    """Check if Tesseract OCR is available on the system.
+
+    Cached: collection calls this per OCR-marked item, and each miss walks
+    the whole PATH.
+    """
     return shutil.which("tesseract") is not None
 
 
@@ -63,10 +71,117 @@ def modal_logic_pdf() -> PdfTestCase:
     return test_case
 
 
+@pytest.fixture(scope="session")
+def process_pdf_cached(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Callable[..., Path]:
+    """Run process_pdf once per (source, mode) and reuse the output.
+
+    Several integration tests run the full pipeline with identical inputs and
+    then only read the result. Extraction dominates their wall time, so the
+    first caller pays for it and the rest share the cached file.
+    """
+    from pdftoc.core import ExtractionMode, process_pdf
+
+    out_dir = tmp_path_factory.mktemp("processed")
+    cache: dict[tuple[Path, ExtractionMode], Path] = {}
+
+    def _process(source: Path, mode: ExtractionMode = ExtractionMode.AUTO) -> Path:
+        key = (source, mode)
+        if key not in cache:
+            output = out_dir / f"{source.stem}_{mode.value}.pdf"
+            process_pdf(
+                source=source,
+                output=output,
+                skip_ocr=True,
+                verbose=False,
+                mode=mode,
+            )
+            cache[key] = output
+        return cache[key]
+
+    return _process
+
+
+@pytest.fixture
+def processed_pdf(
+    pdf_with_text: PdfTestCase, process_pdf_cached: Callable[..., Path]
+) -> Path:
+    """Pipeline output for pdf_with_text in the default mode (session-cached)."""
+    return process_pdf_cached(pdf_with_text.pdf_path)
+
+
+@pytest.fixture(scope="session")
+def open_pdf() -> Iterator[Callable[[Path], fitz.Document]]:
+    """Session-cached fitz.open: one xref parse per path for the whole run.
+
+    The returned documents are shared across tests; treat them as read-only
+    and do not close them — teardown closes every cached handle.
+    """
+    docs: dict[Path, fitz.Document] = {}
+
+    def _open(path: Path) -> fitz.Document:
+        if path not in docs:
+            docs[path] = fitz.open(path)
+        return docs[path]
+
+    yield _open
+    for doc in docs.values():
+        doc.close()
+
+
+@pytest.fixture(scope="session")
+def toc_of(open_pdf: Callable[[Path], fitz.Document]) -> Callable[[Path], list]:
+    """Memoized doc.get_toc() per path; the list is shared, do not mutate it."""
+
+    @cache
+    def _toc(path: Path) -> list:
+        return open_pdf(path).get_toc()
+
+    return _toc
+
+
+@pytest.fixture(scope="session")
+def toc_entries_of(
+    open_pdf: Callable[[Path], fitz.Document],
+) -> Callable[[Path], list]:
+    """Memoized extract_toc_from_text per path; shared list, do not mutate."""
+    from pdftoc.core import extract_toc_from_text
+
+    @cache
+    def _entries(path: Path) -> list:
+        return extract_toc_from_text(open_pdf(path), verbose=False)
+
+    return _entries
+
+
+@pytest.fixture(scope="session")
+def section_headers_of(
+    open_pdf: Callable[[Path], fitz.Document],
+) -> Callable[[Path], list]:
+    """Memoized extract_section_headers per path; shared list, do not mutate."""
+    from pdftoc.core import extract_section_headers
+
+    @cache
+    def _headers(path: Path) -> list:
+        return extract_section_headers(open_pdf(path), verbose=False)
+
+    return _headers
+
+
 @pytest.fixture
-def temp_output_pdf(tmp_path: Path) -> Path:
-    """Fixture providing a temporary output PDF path (cleaned up after test)."""
-    return tmp_path / "output.pdf"
+def temp_output_pdf(
+    request: pytest.FixtureRequest, tmp_path_factory: pytest.TempPathFactory
+) -> Path:
+    """Per-test output PDF path inside one shared session directory.
+
+    One directory for the whole run instead of a mkdtemp per test; the file
+    name carries the test id, so parametrized tests cannot collide, and
+    getbasetemp() is per worker under xdist.
+    """
+    out_dir = tmp_path_factory.getbasetemp() / "pdfout"
+    out_dir.mkdir(exist_ok=True)
+    return out_dir / f"{request.node.name}.pdf"
 
 
 @pytest.fixture
@@ -98,6 +213,9 @@ def pytest_configure(config: pytest.Config) -> None:
     config.addinivalue_line(
         "markers", "llm: mark test as asserting on live LLM TOC extraction"
     )
+    config.addinivalue_line(
+        "markers", "xdist_group(name): run all tests in the group on one worker"
+    )
 
 
 def pytest_collection_modifyitems(
@@ -112,6 +230,15 @@ def pytest_collection_modifyitems(
     llm_available = is_llm_available()
 
     for item in items:
+        # Group per-PDF tests onto one xdist worker (pytest -n auto
+        # --dist=loadgroup): each worker then runs process_pdf once per PDF
+        # via its own session cache, so no cross-process locking is needed.
+        callspec = getattr(item, "callspec", None)
+        if callspec is not None:
+            test_case = callspec.params.get("pdf_with_text")
+            if isinstance(test_case, PdfTestCase):
+                item.add_marker(pytest.mark.xdist_group(test_case.name))
+
         if "llm" in item.keywords and not llm_available:
             item.add_marker(skip_llm)
 
@@ -1,6 +1,7 @@
 """Test case definitions and registry for PDF testing."""
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
 # Root directory for test fixtures
@@ -9,7 +10,7 @@ INPUT_DIR = FIXTURES_DIR / "input"
 OUTPUT_DIR = FIXTURES_DIR / "output"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ExpectedTocEntry:
     """Expected TOC entry for test validation."""
 
@@ -18,7 +19,7 @@ class ExpectedTocEntry:
     level: int  # Expected hierarchy level
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PdfTestCase:
     """Test case definition for a PDF file."""
 
@@ -26,7 +27,7 @@ class PdfTestCase:
     pdf_path: Path
     min_total_entries: int  # Minimum number of TOC entries expected
     has_text: bool = True  # Whether PDF already has OCR text
-    expected_entries: list[ExpectedTocEntry] = field(default_factory=list)
+    expected_entries: tuple[ExpectedTocEntry, ...] = ()
     skip_content_check: bool = False  # Skip keyword-on-page verification
     has_existing_bookmarks: bool = False  # PDF has existing bookmarks
     expected_existing_bookmark_issues: bool = False  # Existing bookmarks are incorrect
@@ -53,9 +54,15 @@ def get_test_pdf(name: str) -> PdfTestCase | None:
     return TEST_PDFS.get(name)
 
 
+@lru_cache(maxsize=1)
+def _existing_test_pdfs() -> tuple[PdfTestCase, ...]:
+    """Registered PDFs present on disk; the exists() probes run once per run."""
+    return tuple(tc for tc in TEST_PDFS.values() if tc.pdf_path.exists())
+
+
 def get_all_test_pdfs() -> list[PdfTestCase]:
     """Get all registered test PDFs that exist on disk."""
-    return [tc for tc in TEST_PDFS.values() if tc.pdf_path.exists()]
+    return list(_existing_test_pdfs())
 
 
 def get_test_pdfs_with_text() -> list[PdfTestCase]:
@@ -68,6 +75,15 @@ def get_test_pdfs_needing_ocr() -> list[PdfTestCase]:
     return [tc for tc in get_all_test_pdfs() if not tc.has_text]
 
 
+def get_pdfs_with_bad_bookmarks() -> list[PdfTestCase]:
+    """Get test PDFs whose shipped bookmarks are known to be wrong."""
+    return [
+        tc
+        for tc in get_all_test_pdfs()
+        if tc.has_existing_bookmarks and tc.expected_existing_bookmark_issues
+    ]
+
+
 # ============================================================================
 # PDF Test Case Definitions - Add new PDFs here
 # ============================================================================
@@ -78,7 +94,7 @@ register_test_pdf(
         pdf_path=INPUT_DIR / "advanced_logic_course_book.pdf",
         min_total_entries=30,
         has_text=True,
-        expected_entries=[
+        expected_entries=(
             ExpectedTocEntry(title_contains="Part I", page=16, level=1),
             ExpectedTocEntry(title_contains="Part II", page=80, level=1),
             ExpectedTocEntry(title_contains="Part III", page=136, level=1),
@@ -93,7 +109,7 @@ register_test_pdf(
                 title_contains="Computation and complexity", page=70, level=2
             ),
             ExpectedTocEntry(title_contains="Index", page=388, level=2),
-        ],
+        ),
     )
 )
 
@@ -105,11 +121,11 @@ register_test_pdf(
         min_total_entries=5,  # NLP heuristics find main sections only
         has_text=True,
         skip_content_check=True,  # Section headers mode doesn't need TOC page check
-        expected_entries=[
+        expected_entries=(
             # Note: levels are normalized, first entry becomes level 1
             ExpectedTocEntry(title_contains="Introduction", page=1, level=1),
             ExpectedTocEntry(title_contains="Extensions", page=27, level=1),
-        ],
+        ),
     )
 )
 
@@ -122,11 +138,11 @@ register_test_pdf(
         has_existing_bookmarks=True,  # Has incorrect bookmarks that should be fixed
         expected_existing_bookmark_issues=True,
         skip_content_check=True,
-        expected_entries=[
+        expected_entries=(
             # Note: levels are normalized, first entry becomes level 1
             ExpectedTocEntry(title_contains="Introduction", page=1, level=1),
             ExpectedTocEntry(title_contains="Motivating Examples", page=3, level=1),
-        ],
+        ),
     )
 )
 
@@ -138,11 +154,11 @@ register_test_pdf(
         min_total_entries=5,
         has_text=True,
         skip_content_check=True,
-        expected_entries=[
+        expected_entries=(
             # Note: levels are normalized, first entry becomes level 1
             ExpectedTocEntry(title_contains="Partial Computation", page=2, level=1),
             ExpectedTocEntry(title_contains="Applications", page=6, level=1),
-        ],
+        ),
     )
 )
 
@@ -154,10 +170,10 @@ register_test_pdf(
         min_total_entries=4,  # NLP heuristics find 4 main sections
         has_text=True,
         skip_content_check=True,
-        expected_entries=[
+        expected_entries=(
             # Note: levels are normalized, first entry becomes level 1
             ExpectedTocEntry(title_contains="HISTORICAL", page=5, level=1),
             ExpectedTocEntry(title_contains="BASIC DEFINITIONS", page=7, level=1),
-        ],
+        ),
     )
 )
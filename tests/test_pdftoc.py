@@ -2,21 +2,23 @@
 
 from __future__ import annotations
 
+import re
+from collections.abc import Callable
 from pathlib import Path
 
 import fitz  # type: ignore
 import pytest
 
-from pdf_test_cases import ExpectedTocEntry, PdfTestCase, get_all_test_pdfs
+from pdf_test_cases import (
+    ExpectedTocEntry,
+    PdfTestCase,
+    get_pdfs_with_bad_bookmarks,
+)
 from pdftoc.core import (
-    ExtractionMode,
     TocEntry,
     add_bookmarks,
-    extract_section_headers,
-    extract_toc_from_text,
     get_existing_bookmarks,
     pdf_has_text,
-    process_pdf,
     verify_bookmarks,
 )
 
@@ -37,21 +39,19 @@ class TestTocExtraction:
     """Tests for TOC extraction functionality."""
 
     def test_extracts_minimum_entries_toc_page(
-        self, pdf_with_text: PdfTestCase
+        self,
+        pdf_with_text: PdfTestCase,
+        toc_entries_of: Callable[[Path], list],
     ) -> None:
         """PDFs with TOC pages should extract entries from them."""
         if pdf_with_text.skip_content_check:
             pytest.skip(f"{pdf_with_text.name} uses section headers, not TOC page")
 
-        doc: fitz.Document = fitz.open(pdf_with_text.pdf_path)
-        try:
-            entries = extract_toc_from_text(doc, verbose=False)
-            assert len(entries) >= pdf_with_text.min_total_entries, (
-                f"[{pdf_with_text.name}] Expected at least {pdf_with_text.min_total_entries} "
-                f"entries, got {len(entries)}"
-            )
-        finally:
-            doc.close()
+        entries = toc_entries_of(pdf_with_text.pdf_path)
+        assert len(entries) >= pdf_with_text.min_total_entries, (
+            f"[{pdf_with_text.name}] Expected at least {pdf_with_text.min_total_entries} "
+            f"entries, got {len(entries)}"
+        )
 
 
 class TestAddBookmarks:
@@ -89,61 +89,48 @@ class TestProcessPdf:
     """Integration tests for the full PDF processing pipeline."""
 
     def test_full_processing(
-        self, pdf_with_text: PdfTestCase, temp_output_pdf: Path
+        self,
+        pdf_with_text: PdfTestCase,
+        processed_pdf: Path,
+        toc_of: Callable[[Path], list],
     ) -> None:
         """Full processing should produce a PDF with correct bookmarks."""
         if pdf_with_text.extraction_unsupported:
             pytest.xfail(f"TOC extraction unsupported for {pdf_with_text.name}")
 
-        process_pdf(
-            source=pdf_with_text.pdf_path,
-            output=temp_output_pdf,
-            skip_ocr=True,
-            verbose=False,
-        )
-
-        assert temp_output_pdf.exists()
+        assert processed_pdf.exists()
 
-        doc: fitz.Document = fitz.open(temp_output_pdf)
-        try:
-            toc = doc.get_toc()
-            assert len(toc) >= pdf_with_text.min_total_entries, (
-                f"[{pdf_with_text.name}] Expected at least {pdf_with_text.min_total_entries} "
-                f"bookmarks, got {len(toc)}"
-            )
-        finally:
-            doc.close()
+        toc = toc_of(processed_pdf)
+        assert len(toc) >= pdf_with_text.min_total_entries, (
+            f"[{pdf_with_text.name}] Expected at least {pdf_with_text.min_total_entries} "
+            f"bookmarks, got {len(toc)}"
+        )
 
     def test_bookmark_hierarchy(
-        self, pdf_with_text: PdfTestCase, temp_output_pdf: Path
+        self,
+        pdf_with_text: PdfTestCase,
+        processed_pdf: Path,
+        toc_of: Callable[[Path], list],
     ) -> None:
         """Bookmarks should have proper hierarchy (no level skips)."""
-        process_pdf(
-            source=pdf_with_text.pdf_path,
-            output=temp_output_pdf,
-            skip_ocr=True,
-            verbose=False,
-        )
+        toc = toc_of(processed_pdf)
 
-        doc: fitz.Document = fitz.open(temp_output_pdf)
-        try:
-            toc = doc.get_toc()
+        assert toc[0][0] == 1, "First TOC entry must be level 1"
 
-            assert toc[0][0] == 1, "First TOC entry must be level 1"
-
-            prev_level = 0
-            for entry in toc:
-                level = entry[0]
-                assert level <= prev_level + 1, (
-                    f"[{pdf_with_text.name}] Level jumped from {prev_level} to {level} "
-                    f"at '{entry[1]}'"
-                )
-                prev_level = level
-        finally:
-            doc.close()
+        prev_level = 0
+        for entry in toc:
+            level = entry[0]
+            assert level <= prev_level + 1, (
+                f"[{pdf_with_text.name}] Level jumped from {prev_level} to {level} "
+                f"at '{entry[1]}'"
+            )
+            prev_level = level
 
     def test_expected_entries_present(
-        self, pdf_with_text: PdfTestCase, temp_output_pdf: Path
+        self,
+        pdf_with_text: PdfTestCase,
+        processed_pdf: Path,
+        toc_of: Callable[[Path], list],
     ) -> None:
         """Specific expected entries should be present with correct pages."""
         if pdf_with_text.extraction_unsupported:
@@ -152,56 +139,45 @@ class TestProcessPdf:
         if not pdf_with_text.expected_entries:
             pytest.skip(f"No expected entries defined for {pdf_with_text.name}")
 
-        process_pdf(
-            source=pdf_with_text.pdf_path,
-            output=temp_output_pdf,
-            skip_ocr=True,
-            verbose=False,
+        toc = toc_of(processed_pdf)
+        _verify_expected_entries(
+            toc, pdf_with_text.expected_entries, pdf_with_text.name
         )
 
-        doc: fitz.Document = fitz.open(temp_output_pdf)
-        try:
-            toc = doc.get_toc()
-            for expected in pdf_with_text.expected_entries:
-                _verify_entry_exists(toc, expected, pdf_with_text.name)
-        finally:
-            doc.close()
-
     def test_bookmarks_link_to_correct_content(
-        self, pdf_with_text: PdfTestCase, temp_output_pdf: Path
+        self,
+        pdf_with_text: PdfTestCase,
+        processed_pdf: Path,
+        open_pdf: Callable[[Path], fitz.Document],
+        toc_of: Callable[[Path], list],
     ) -> None:
         """Bookmark pages should contain the expected chapter content."""
         if pdf_with_text.skip_content_check:
             pytest.skip(f"Content check skipped for {pdf_with_text.name}")
 
-        process_pdf(
-            source=pdf_with_text.pdf_path,
-            output=temp_output_pdf,
-            skip_ocr=True,
-            verbose=False,
-        )
-
-        doc: fitz.Document = fitz.open(temp_output_pdf)
-        try:
-            toc = doc.get_toc()
-            checked = 0
-            for entry in toc:
-                level, title, page = entry[:3]
-                keywords = [
-                    w.lower() for w in title.split() if len(w) > 4 and w.isalpha()
-                ]
-                if len(keywords) >= 2:
+        doc = open_pdf(processed_pdf)
+        toc = toc_of(processed_pdf)
+        # Several entries can land on the same page; lower each page once.
+        page_text_cache: dict[int, str] = {}
+        checked = 0
+        for entry in toc:
+            level, title, page = entry[:3]
+            keywords = [w.lower() for w in title.split() if len(w) > 4 and w.isalpha()][
+                :3
+            ]
+            if len(keywords) >= 2:
+                page_text = page_text_cache.get(page)
+                if page_text is None:
                     page_text = doc[page - 1].get_text().lower()
-                    found = any(kw in page_text for kw in keywords[:3])
-                    assert found, (
-                        f"[{pdf_with_text.name}] No keywords from '{title}' "
-                        f"found on page {page}"
-                    )
-                    checked += 1
-                    if checked >= 5:
-                        break
-        finally:
-            doc.close()
+                    page_text_cache[page] = page_text
+                found = any(kw in page_text for kw in keywords)
+                assert found, (
+                    f"[{pdf_with_text.name}] No keywords from '{title}' "
+                    f"found on page {page}"
+                )
+                checked += 1
+                if checked >= 5:
+                    break
 
 
 # ============================================================================
@@ -213,29 +189,27 @@ class TestModalLogicSpecific:
     """Tests specific to the modal logic textbook structure."""
 
     @pytest.mark.llm
-    def test_extracts_parts(self, modal_logic_pdf: PdfTestCase) -> None:
+    def test_extracts_parts(
+        self,
+        modal_logic_pdf: PdfTestCase,
+        toc_entries_of: Callable[[Path], list],
+    ) -> None:
         """Should extract Part entries at level 1."""
-        doc: fitz.Document = fitz.open(modal_logic_pdf.pdf_path)
-        try:
-            entries = extract_toc_from_text(doc, verbose=False)
-            part_entries = [e for e in entries if "Part" in e.title]
-            assert len(part_entries) >= 4, (
-                f"Expected 4 parts, found {len(part_entries)}"
-            )
-        finally:
-            doc.close()
-
-    def test_extracts_chapters(self, modal_logic_pdf: PdfTestCase) -> None:
+        entries = toc_entries_of(modal_logic_pdf.pdf_path)
+        part_entries = [e for e in entries if "Part" in e.title]
+        assert len(part_entries) >= 4, f"Expected 4 parts, found {len(part_entries)}"
+
+    def test_extracts_chapters(
+        self,
+        modal_logic_pdf: PdfTestCase,
+        toc_entries_of: Callable[[Path], list],
+    ) -> None:
         """Should extract numbered chapter entries."""
-        doc: fitz.Document = fitz.open(modal_logic_pdf.pdf_path)
-        try:
-            entries = extract_toc_from_text(doc, verbose=False)
-            chapter_entries = [e for e in entries if e.title[0].isdigit()]
-            assert len(chapter_entries) >= 20, (
-                f"Expected at least 20 chapters, found {len(chapter_entries)}"
-            )
-        finally:
-            doc.close()
+        entries = toc_entries_of(modal_logic_pdf.pdf_path)
+        chapter_entries = [e for e in entries if e.title[0].isdigit()]
+        assert len(chapter_entries) >= 20, (
+            f"Expected at least 20 chapters, found {len(chapter_entries)}"
+        )
 
 
 # ============================================================================
@@ -243,26 +217,42 @@ class TestModalLogicSpecific:
 # ============================================================================
 
 
-def _verify_entry_exists(
-    toc: list[list[int | str]], expected: ExpectedTocEntry, pdf_name: str
+def _verify_expected_entries(
+    toc: list[list[int | str]],
+    expected_entries: tuple[ExpectedTocEntry, ...],
+    pdf_name: str,
 ) -> None:
-    """Verify an expected entry exists in the TOC."""
+    """Verify expected entries appear in the TOC, scanning it only once.
+
+    One combined pattern finds every expected substring per title instead of
+    rescanning the whole TOC for each expected entry. Longer substrings come
+    first so "Part II" is not shadowed by "Part I" at the same position; as
+    before, the first TOC entry containing a substring is the one checked.
+    """
+    subs = sorted((e.title_contains for e in expected_entries), key=len, reverse=True)
+    pattern = re.compile("|".join(map(re.escape, subs)))
+    first_hit: dict[str, tuple[int, int]] = {}
     for entry in toc:
         level, title, page = entry[:3]
-        if expected.title_contains in str(title):
-            assert abs(int(page) - expected.page) <= 5, (
-                f"[{pdf_name}] Entry '{expected.title_contains}' at wrong page: "
-                f"expected ~{expected.page}, got {page}"
+        for match in pattern.finditer(str(title)):
+            first_hit.setdefault(match.group(), (int(level), int(page)))
+
+    for expected in expected_entries:
+        hit = first_hit.get(expected.title_contains)
+        if hit is None:
+            pytest.fail(
+                f"[{pdf_name}] Expected entry containing "
+                f"'{expected.title_contains}' not found"
             )
-            assert level == expected.level, (
-                f"[{pdf_name}] Entry '{expected.title_contains}' at wrong level: "
-                f"expected {expected.level}, got {level}"
-            )
-            return
-
-    pytest.fail(
-        f"[{pdf_name}] Expected entry containing '{expected.title_contains}' not found"
-    )
+        level, page = hit
+        assert abs(page - expected.page) <= 5, (
+            f"[{pdf_name}] Entry '{expected.title_contains}' at wrong page: "
+            f"expected ~{expected.page}, got {page}"
+        )
+        assert level == expected.level, (
+            f"[{pdf_name}] Entry '{expected.title_contains}' at wrong level: "
+            f"expected {expected.level}, got {level}"
+        )
 
 
 # ============================================================================
@@ -273,31 +263,38 @@ def _verify_entry_exists(
 class TestSectionHeaderExtraction:
     """Tests for section header extraction mode."""
 
-    def test_extracts_section_headers(self, pdf_with_text: PdfTestCase) -> None:
+    def test_extracts_section_headers(
+        self,
+        pdf_with_text: PdfTestCase,
+        section_headers_of: Callable[[Path], list],
+    ) -> None:
         """Section header extraction should find headers in the document."""
-        doc: fitz.Document = fitz.open(pdf_with_text.pdf_path)
-        try:
-            entries = extract_section_headers(doc, verbose=False)
-            # All PDFs should have some section headers
-            assert len(entries) >= 1, (
-                f"[{pdf_with_text.name}] Expected at least 1 section header, "
-                f"got {len(entries)}"
-            )
-        finally:
-            doc.close()
+        entries = section_headers_of(pdf_with_text.pdf_path)
+        # All PDFs should have some section headers
+        assert len(entries) >= 1, (
+            f"[{pdf_with_text.name}] Expected at least 1 section header, "
+            f"got {len(entries)}"
+        )
 
-    def test_section_headers_have_valid_pages(self, pdf_with_text: PdfTestCase) -> None:
+    def test_section_headers_have_valid_pages(
+        self,
+        pdf_with_text: PdfTestCase,
+        open_pdf: Callable[[Path], fitz.Document],
+        section_headers_of: Callable[[Path], list],
+    ) -> None:
         """Section headers should point to valid page numbers."""
-        doc: fitz.Document = fitz.open(pdf_with_text.pdf_path)
-        try:
-            entries = extract_section_headers(doc, verbose=False)
-            for entry in entries:
-                assert 1 <= entry.page <= len(doc), (
-                    f"[{pdf_with_text.name}] Section '{entry.title}' has invalid "
-                    f"page {entry.page}"
-                )
-        finally:
-            doc.close()
+        doc = open_pdf(pdf_with_text.pdf_path)
+        entries = section_headers_of(pdf_with_text.pdf_path)
+        pages = [entry.page for entry in entries]
+        assert not pages or (min(pages) >= 1 and max(pages) <= len(doc)), (
+            f"[{pdf_with_text.name}] Sections with invalid pages "
+            f"(document has {len(doc)}): "
+            + ", ".join(
+                f"'{entry.title}' -> {entry.page}"
+                for entry in entries
+                if not 1 <= entry.page <= len(doc)
+            )
+        )
 
 
 # ============================================================================
@@ -308,51 +305,36 @@ class TestSectionHeaderExtraction:
 class TestBookmarkVerification:
     """Tests for bookmark verification functionality."""
 
-    def test_detects_bad_bookmarks(self) -> None:
+    def test_detects_bad_bookmarks(
+        self, open_pdf: Callable[[Path], fitz.Document]
+    ) -> None:
         """Should detect structurally bad bookmarks."""
-        # Get a PDF with known bad bookmarks
-        for test_case in get_all_test_pdfs():
-            if (
-                test_case.has_existing_bookmarks
-                and test_case.expected_existing_bookmark_issues
-            ):
-                doc: fitz.Document = fitz.open(test_case.pdf_path)
-                try:
-                    existing = get_existing_bookmarks(doc)
-                    is_valid, issues = verify_bookmarks(doc, existing, verbose=False)
-                    assert not is_valid, (
-                        f"[{test_case.name}] Expected bad bookmarks to be detected"
-                    )
-                    assert len(issues) > 0
-                finally:
-                    doc.close()
-                return
-        pytest.skip("No PDF with expected bookmark issues available")
+        bad_pdfs = get_pdfs_with_bad_bookmarks()
+        if not bad_pdfs:
+            pytest.skip("No PDF with expected bookmark issues available")
+
+        test_case = bad_pdfs[0]
+        doc = open_pdf(test_case.pdf_path)
+        existing = get_existing_bookmarks(doc)
+        is_valid, issues = verify_bookmarks(doc, existing, verbose=False)
+        assert not is_valid, f"[{test_case.name}] Expected bad bookmarks to be detected"
+        assert len(issues) > 0
 
     def test_accepts_good_bookmarks(
-        self, pdf_with_text: PdfTestCase, temp_output_pdf: Path
+        self,
+        pdf_with_text: PdfTestCase,
+        processed_pdf: Path,
+        open_pdf: Callable[[Path], fitz.Document],
     ) -> None:
         """Should accept well-formed bookmarks."""
-        # Generate good bookmarks first
-        process_pdf(
-            source=pdf_with_text.pdf_path,
-            output=temp_output_pdf,
-            skip_ocr=True,
-            verbose=False,
-            mode=ExtractionMode.AUTO,
-        )
-
-        doc: fitz.Document = fitz.open(temp_output_pdf)
-        try:
-            existing = get_existing_bookmarks(doc)
-            if len(existing) > 3:  # Only test if we have enough bookmarks
-                is_valid, issues = verify_bookmarks(doc, existing, verbose=False)
-                assert is_valid, (
-                    f"[{pdf_with_text.name}] Generated bookmarks should be valid. "
-                    f"Issues: {issues}"
-                )
-        finally:
-            doc.close()
+        doc = open_pdf(processed_pdf)
+        existing = get_existing_bookmarks(doc)
+        if len(existing) > 3:  # Only test if we have enough bookmarks
+            is_valid, issues = verify_bookmarks(doc, existing, verbose=False)
+            assert is_valid, (
+                f"[{pdf_with_text.name}] Generated bookmarks should be valid. "
+                f"Issues: {issues}"
+            )
 
 
 # ============================================================================
@@ -364,26 +346,17 @@ class TestAutoMode:
     """Tests for auto extraction mode."""
 
     def test_auto_mode_finds_entries(
-        self, pdf_with_text: PdfTestCase, temp_output_pdf: Path
+        self,
+        pdf_with_text: PdfTestCase,
+        processed_pdf: Path,
+        toc_of: Callable[[Path], list],
     ) -> None:
         """Auto mode should find entries regardless of PDF type."""
         if pdf_with_text.extraction_unsupported:
             pytest.xfail(f"TOC extraction unsupported for {pdf_with_text.name}")
 
-        process_pdf(
-            source=pdf_with_text.pdf_path,
-            output=temp_output_pdf,
-            skip_ocr=True,
-            verbose=False,
-            mode=ExtractionMode.AUTO,
+        toc = toc_of(processed_pdf)
+        assert len(toc) >= pdf_with_text.min_total_entries, (
+            f"[{pdf_with_text.name}] Auto mode expected at least "
+            f"{pdf_with_text.min_total_entries} entries, got {len(toc)}"
         )
-
-        doc: fitz.Document = fitz.open(temp_output_pdf)
-        try:
-            toc = doc.get_toc()
-            assert len(toc) >= pdf_with_text.min_total_entries, (
-                f"[{pdf_with_text.name}] Auto mode expected at least "
-                f"{pdf_with_text.min_total_entries} entries, got {len(toc)}"
-            )
-        finally:
-            doc.close()